@@ -6,24 +6,84 @@ A modern GUI application that connects to the Asana API and displays progress ba
 for all projects with a beautiful cross-platform interface.
 """
 
+import bisect
+import functools
 import os
 import sys
 import threading
+import time
 import tkinter as tk
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Tuple
 import asana
+import diskcache
 import keyring
 import getpass
+import requests
 import customtkinter as ctk
 from PIL import Image, ImageTk
 import json
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
 # Set appearance mode and color theme
 ctk.set_appearance_mode("dark")  # Modes: "System" (standard), "Dark", "Light"
 ctk.set_default_color_theme("blue")  # Themes: "blue" (standard), "green", "dark-blue"
 
+# Number of Asana /batch requests in flight concurrently during a refresh
+MAX_FETCH_WORKERS = 16
+# Number of workspaces whose project lists are fetched concurrently
+MAX_WORKSPACE_WORKERS = 8
+# Projects per Asana /batch request (up to 3 sub-requests each, API limit is 10 actions)
+BATCH_PROJECTS = 3
+# Retries of a /batch request whose sub-requests were rate limited (429) or failed (5xx)
+BATCH_MAX_RETRIES = 3
+BATCH_RETRY_DELAY = 1.0
+# Minimum seconds between loading progress updates sent to the UI thread (~30 Hz)
+PROGRESS_UPDATE_INTERVAL = 1 / 30
+# On-disk cache of per-project task states, refreshed incrementally with modified_since
+CACHE_DIR = os.path.expanduser("~/.asana_tracker_cache")
+# modified_since never reports tasks that were deleted or moved out of a project. Those are
+# caught by comparing against the project's task count, and as a backstop task states are
+# rebuilt from a full fetch this long after the last one
+CACHE_EXPIRE_SECONDS = 7 * 86400
+# The next modified_since cursor is moved back by this much so a local clock running
+# ahead of Asana's does not skip changes; re-folding a task that did not change is harmless
+MODIFIED_SINCE_MARGIN_SECONDS = 5 * 60
+
+# Project table layout (widths must match between header and rows)
+COLUMN_WIDTHS = [240, 200, 90, 100]
+WORKSPACE_HEADER_WIDTH = 630  # sum of all column widths + paddings
+ROW_HEIGHT = 30
+
+# Status text for the color of an Asana project status update
+_STATUS_BY_COLOR = {
+    'green': 'On track',
+    'blue': 'On hold',
+    'yellow': 'At risk',
+    'red': 'Off track',
+    'complete': 'Completed',
+}
+
+# Display color for a casefolded project status text
+_COLOR_BY_STATUS = {
+    'on track': "#00ff00",  # Green
+    'on hold': "#0080ff",  # Blue
+    'at risk': "#ffff00",  # Yellow
+    'off track': "#ff0000",  # Red
+    'completed': "#00ff00",  # Green
+}
+
 class AsanaProgressTrackerGUI:
+    # Shared fonts for the project table and summary, created once Tk exists
+    _FONT_NAME = None
+    _FONT_MONO = None
+    _FONT_STATUS = None
+    _FONT_HEADER = None
+    _FONT_SECTION = None
+    _FONT_CAPTION = None
+    _FONT_VALUE = None
+    _FONT_TEXT = None
+    
     def __init__(self):
         """
         Initialize the Asana progress tracker GUI.
@@ -35,7 +95,23 @@ class AsanaProgressTrackerGUI:
         
         # Initialize variables
         self.client = None
+        self._cached_api_key = None
+        try:
+            self.cache = diskcache.Cache(CACHE_DIR)
+        except Exception:
+            # Run without the on-disk cache, every refresh fetches projects in full
+            self.cache = None
         self.projects_data = []
+        self.display_items = []
+        self.all_items = []
+        self.items_by_workspace = {}
+        self.sort_keys_by_workspace = {}
+        self.workspace_names = []
+        self.row_pool = []
+        self.summary_value_labels = []
+        self._summary_source = None
+        self._summary_counts = None
+        self.first_visible_item = 0
         self.current_workspace_filter = "All Workspaces"
         
         # Setup UI
@@ -53,6 +129,8 @@ class AsanaProgressTrackerGUI:
         """
         Setup the main UI components.
         """
+        self._init_fonts()
+        
         # Configure grid
         self.root.grid_columnconfigure(0, weight=1)
         self.root.grid_rowconfigure(1, weight=1)
@@ -123,10 +201,43 @@ class AsanaProgressTrackerGUI:
         self.summary_frame.grid(row=0, column=0, padx=20, pady=(20, 10), sticky="ew")
         self.summary_frame.grid_columnconfigure(0, weight=1)
         
-        # Projects scrollable frame
-        self.projects_frame = ctk.CTkScrollableFrame(main_frame)
+        # Projects frame
+        self.projects_frame = ctk.CTkFrame(main_frame)
         self.projects_frame.grid(row=1, column=0, padx=20, pady=(10, 20), sticky="nsew")
         self.projects_frame.grid_columnconfigure(0, weight=1)
+        self.projects_frame.grid_rowconfigure(3, weight=1)
+        
+        # Project table, only rows in view are backed by widgets (rows are recycled on scroll)
+        self.list_frame = ctk.CTkFrame(self.projects_frame, fg_color="transparent")
+        self.list_frame.grid(row=3, column=0, padx=20, pady=(10, 10), sticky="nsew")
+        self.list_frame.grid_columnconfigure(0, weight=1)
+        self.list_frame.grid_rowconfigure(1, weight=1)
+        self.list_frame.grid_remove()
+        
+        # Table header
+        table_header = ctk.CTkFrame(self.list_frame, fg_color="transparent")
+        table_header.grid(row=0, column=0, padx=0, pady=(0, 0), sticky="ew")
+        table_header.grid_columnconfigure(1, weight=1)  # Make progress column expandable
+        for column, (text, anchor) in enumerate([("Project Name", "w"), ("Progress", "w"), ("Tasks", "e"), ("Status", "w")]):
+            ctk.CTkLabel(
+                table_header,
+                text=text,
+                font=self._FONT_HEADER,
+                text_color="#bbbbbb",
+                width=COLUMN_WIDTHS[column],
+                anchor=anchor
+            ).grid(row=0, column=column, padx=(2, 18) if column == 2 else 2, pady=4, sticky=anchor)
+        
+        self.rows_frame = ctk.CTkFrame(self.list_frame, fg_color="transparent")
+        self.rows_frame.grid(row=1, column=0, sticky="nsew")
+        self.rows_frame.grid_columnconfigure(0, weight=1)
+        self.rows_frame.bind("<Configure>", lambda event: self._render_visible_rows())
+        
+        self.projects_scrollbar = ctk.CTkScrollbar(self.list_frame, command=self._on_projects_scroll)
+        self.projects_scrollbar.grid(row=1, column=1, sticky="ns")
+        self.root.bind_all("<MouseWheel>", self._on_projects_mousewheel, add="+")
+        self.root.bind_all("<Button-4>", self._on_projects_mousewheel, add="+")
+        self.root.bind_all("<Button-5>", self._on_projects_mousewheel, add="+")
         
         # Loading indicator
         self.loading_label = ctk.CTkLabel(
@@ -136,12 +247,25 @@ class AsanaProgressTrackerGUI:
         )
         self.loading_label.grid(row=0, column=0, padx=20, pady=50)
     
+    @classmethod
+    def _init_fonts(cls):
+        if cls._FONT_NAME is not None:
+            return
+        cls._FONT_NAME = ctk.CTkFont(size=13, weight="bold")
+        cls._FONT_MONO = ctk.CTkFont(family="Consolas", size=12)
+        cls._FONT_STATUS = ctk.CTkFont(size=12)
+        cls._FONT_HEADER = ctk.CTkFont(size=13, weight="bold")
+        cls._FONT_SECTION = ctk.CTkFont(size=16, weight="bold")
+        cls._FONT_CAPTION = ctk.CTkFont(size=12)
+        cls._FONT_VALUE = ctk.CTkFont(size=20, weight="bold")
+        cls._FONT_TEXT = ctk.CTkFont(size=14)
+    
     def load_api_key(self):
         """
         Try to load API key from keychain and connect to Asana.
         """
         try:
-            stored_key = keyring.get_password("asana_cli", "api_key")
+            stored_key = self.get_stored_api_key()
             if stored_key:
                 self.connect_to_asana(stored_key)
             else:
@@ -149,6 +273,17 @@ class AsanaProgressTrackerGUI:
         except Exception as e:
             self.status_label.configure(text=f"Error: {str(e)}", text_color="red")
     
+    def get_stored_api_key(self):
+        """
+        Get the API key from keychain, keeping it in memory after the first lookup.
+        
+        Returns:
+            Stored API key or None
+        """
+        if self._cached_api_key is None:
+            self._cached_api_key = keyring.get_password("asana_cli", "api_key")
+        return self._cached_api_key
+    
     def connect_to_asana(self, api_key: str):
         """
         Connect to Asana API.
@@ -158,6 +293,9 @@ class AsanaProgressTrackerGUI:
         """
         try:
             self.client = asana.Client.access_token(api_key)
+            # Keep a keep-alive connection per fetch worker; requests only pools 10 by default
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=MAX_FETCH_WORKERS)
+            self.client.session.mount("https://", adapter)
             # Test the connection
             self.client.users.me()
             self.status_label.configure(text="Connected to Asana", text_color="green")
@@ -208,7 +346,7 @@ class AsanaProgressTrackerGUI:
         
         # Try to load current API key
         try:
-            stored_key = keyring.get_password("asana_cli", "api_key")
+            stored_key = self.get_stored_api_key()
             if stored_key:
                 api_key_entry.insert(0, stored_key)
         except:
@@ -223,6 +361,7 @@ class AsanaProgressTrackerGUI:
             if api_key:
                 try:
                     keyring.set_password("asana_cli", "api_key", api_key)
+                    self._cached_api_key = api_key
                     if self.connect_to_asana(api_key):
                         self.status_label.configure(text="Connected to Asana", text_color="green")
                         settings_window.destroy()
@@ -236,6 +375,7 @@ class AsanaProgressTrackerGUI:
         def clear_api_key():
             try:
                 keyring.delete_password("asana_cli", "api_key")
+                self._cached_api_key = None
                 api_key_entry.delete(0, "end")
                 self.client = None
                 self.status_label.configure(text="API key cleared", text_color="orange")
@@ -317,21 +457,39 @@ To get your Asana API key:
             # Get all projects
             projects = self.get_all_projects()
             total = len(projects)
-            project_progress = []
-            for idx, project in enumerate(projects):
-                progress_info = self.get_project_progress(project)
-                project_progress.append(progress_info)
-                percent = (idx + 1) / total if total > 0 else 1
-                self.root.after(0, lambda p=percent: self.loading_progress.set(p))
-                self.root.after(0, lambda p=percent: self.loading_percent_label.configure(text=f"{int(p*100)}%"))
+            loaded = 0
+            chunks = [projects[i:i + BATCH_PROJECTS] for i in range(0, total, BATCH_PROJECTS)]
+            # Fetch batches concurrently; each call is dominated by network I/O
+            last_ui_update = 0.0
+            pending_rows = []
+            with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+                futures = [executor.submit(self._batch_fetch, chunk) for chunk in chunks]
+                for future in as_completed(futures):
+                    results = future.result()
+                    loaded += len(results)
+                    pending_rows.extend(results)
+                    # Coalesce new rows and progress updates so the Tk event queue is not flooded
+                    now = time.monotonic()
+                    if now - last_ui_update >= PROGRESS_UPDATE_INTERVAL or loaded == total:
+                        last_ui_update = now
+                        percent = loaded / total if total > 0 else 1
+                        self.root.after(0, self.append_project_rows, pending_rows)
+                        self.root.after(0, self._set_loading_progress, percent)
+                        pending_rows = []
             # Update UI in main thread
-            self.root.after(0, lambda: self.update_projects_display(project_progress))
+            if pending_rows:
+                self.root.after(0, self.append_project_rows, pending_rows)
+            self.root.after(0, self.finish_projects_display)
             self.root.after(0, self._hide_loading_progress)
         except Exception as e:
             self.root.after(0, lambda: self.show_error(f"Error loading projects: {str(e)}"))
         finally:
             self.root.after(0, lambda: self.refresh_button.configure(state="normal"))
     
+    def _set_loading_progress(self, percent: float):
+        self.loading_progress.set(percent)
+        self.loading_percent_label.configure(text=f"{int(percent*100)}%")
+    
     def _hide_loading_progress(self):
         if hasattr(self, 'loading_progress'):
             self.loading_progress.destroy()
@@ -346,27 +504,158 @@ To get your Asana API key:
             List of project dictionaries
         """
         # Get all workspaces
-        workspaces = self.client.workspaces.find_all()
+        workspaces = list(self.client.workspaces.find_all())
         
+        # Fetch the projects of every workspace concurrently
         all_projects = []
-        for workspace in workspaces:
-            workspace_name = workspace.get('name', 'Unknown Workspace')
+        with ThreadPoolExecutor(max_workers=MAX_WORKSPACE_WORKERS) as executor:
+            for projects in executor.map(self._fetch_workspace_projects, workspaces):
+                all_projects.extend(projects)
+        
+        return all_projects
+    
+    def _fetch_workspace_projects(self, workspace: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Fetch the projects of a single workspace.
+        
+        Args:
+            workspace: Workspace dictionary from Asana API
             
-            # Get projects in this workspace
-            projects = self.client.projects.find_all({
-                'workspace': workspace['gid'],
-                'opt_fields': 'name,completed,completed_at,owner,team,notes,color,created_at,due_date,start_on,archived'
-            })
+        Returns:
+            List of project dictionaries tagged with the workspace name
+        """
+        workspace_name = workspace.get('name', 'Unknown Workspace')
+        
+        # Get projects in this workspace
+        projects = self.client.projects.find_all({
+            'workspace': workspace['gid'],
+            'opt_fields': 'name,completed,completed_at,owner,team,notes,color,created_at,due_date,start_on,archived'
+        })
+        
+        return [dict(project, workspace_name=workspace_name) for project in projects]
+    
+    def _batch_fetch(self, projects_chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Fetch tasks and statuses for several projects in a single Asana /batch request.
+        Projects with a cached entry only fetch tasks modified since the last refresh.
+        
+        Args:
+            projects_chunk: Up to BATCH_PROJECTS project dictionaries
             
-            for project in projects:
-                project['workspace_name'] = workspace_name
-                all_projects.append(project)
+        Returns:
+            List of progress dictionaries, one per project
+        """
+        actions = []
+        plans = []
+        for project in projects_chunk:
+            tasks_entry = self._incremental_entry(self.get_cached_entry(project))
+            tasks_idx = len(actions)
+            actions.append(self._tasks_action(project, tasks_entry))
+            counts_idx = None
+            if tasks_entry:
+                counts_idx = len(actions)
+                actions.append({
+                    'relative_path': f"/projects/{project['gid']}/task_counts",
+                    'method': 'get',
+                    'options': {'fields': ['num_tasks']}
+                })
+            status_idx = None
+            if not self._is_finished(project):
+                status_idx = len(actions)
+                actions.append({
+                    'relative_path': f"/projects/{project['gid']}/project_statuses",
+                    'method': 'get',
+                    'options': {'fields': ['text', 'color', 'created_at']}
+                })
+            plans.append((project, tasks_entry, tasks_idx, counts_idx, status_idx))
         
-        return all_projects
+        for attempt in range(BATCH_MAX_RETRIES + 1):
+            fetched_at = datetime.now(timezone.utc).isoformat()
+            try:
+                responses = self.client.post('/batch', {'actions': actions})
+            except asana.error.RetryableAsanaError:
+                # Rate limited or server errors even after the client's own retries; more
+                # requests would only add load, so report the projects as failed
+                return [self.build_error_info(project) for project in projects_chunk]
+            except Exception:
+                # Batch endpoint unavailable, fall back to one project at a time
+                return [self.get_project_progress(project) for project in projects_chunk]
+            
+            retry_after = self._batch_retry_after(responses, attempt)
+            if retry_after is None or attempt == BATCH_MAX_RETRIES:
+                break
+            time.sleep(retry_after)
+        
+        results = []
+        for project, tasks_entry, tasks_idx, counts_idx, status_idx in plans:
+            tasks_response = responses[tasks_idx]
+            tasks_status = tasks_response.get('status_code', 500)
+            if tasks_status == 429 or tasks_status >= 500:
+                # Still rate limited or failing after retries, don't add per-project requests
+                results.append(self.build_error_info(project))
+                continue
+            if tasks_status >= 400:
+                results.append(self.get_project_progress(project))
+                continue
+            try:
+                body = tasks_response.get('body') or {}
+                task_states = dict(tasks_entry['task_states']) if tasks_entry else {}
+                self._fold_tasks(task_states, body.get('data', []))
+                
+                # Sub-requests are not paginated for us, continue past the first page
+                next_page = body.get('next_page')
+                if next_page:
+                    self._fold_tasks(task_states, self._find_tasks(project, tasks_entry, offset=next_page['offset']))
+                
+                if counts_idx is not None and responses[counts_idx].get('status_code', 500) < 400:
+                    num_tasks = ((responses[counts_idx].get('body') or {}).get('data') or {}).get('num_tasks')
+                    task_states, tasks_entry = self._check_task_count(project, task_states, tasks_entry, num_tasks)
+                
+                if status_idx is None:
+                    # Completed and archived projects are labelled from the project itself
+                    status_text = self.get_fallback_status_text(project)
+                elif responses[status_idx].get('status_code', 500) < 400:
+                    statuses = (responses[status_idx].get('body') or {}).get('data', [])
+                    status_text = self.get_status_text(statuses)
+                else:
+                    status_text = self.get_fallback_status_text(project)
+                
+                results.append(self._store_progress(project, task_states, status_text, fetched_at, tasks_entry))
+            except Exception:
+                results.append(self.build_error_info(project))
+        
+        return results
+    
+    def _batch_retry_after(self, responses: List[Dict[str, Any]], attempt: int):
+        """
+        Get how long to wait before retrying a batch with rate limited or failed sub-requests.
+        
+        Args:
+            responses: Sub-request responses from Asana /batch
+            attempt: Number of retries made so far
+            
+        Returns:
+            Seconds to wait, or None if no sub-request needs a retry
+        """
+        retry_after = None
+        for response in responses:
+            status_code = response.get('status_code', 500)
+            if status_code != 429 and status_code < 500:
+                continue
+            delay = BATCH_RETRY_DELAY * (2 ** attempt)
+            for name, value in (response.get('headers') or {}).items():
+                if name.lower() == 'retry-after':
+                    try:
+                        delay = float(value)
+                    except (TypeError, ValueError):
+                        pass
+            retry_after = max(retry_after or 0, delay)
+        return retry_after
     
     def get_project_progress(self, project: Dict[str, Any]) -> Dict[str, Any]:
         """
         Calculate progress for a specific project based on completed tasks.
+        Projects with a cached entry only fetch tasks modified since the last refresh.
         
         Args:
             project: Project dictionary from Asana API
@@ -376,243 +665,494 @@ To get your Asana API key:
         """
         try:
             project_gid = project['gid']
-            project_name = project.get('name', 'Unnamed Project')
-            
-            # Get all tasks in the project
-            tasks_generator = self.client.tasks.find_by_project(project_gid, {
-                'opt_fields': 'completed,completed_at,name'
-            })
-            
-            # Convert generator to list
-            tasks = list(tasks_generator)
+            tasks_entry = self._incremental_entry(self.get_cached_entry(project))
+            fetched_at = datetime.now(timezone.utc).isoformat()
             
-            total_tasks = len(tasks)
-            completed_tasks = sum(1 for task in tasks if task.get('completed', False))
+            # Get tasks in the project and fold them into the cached completion states
+            task_states = dict(tasks_entry['task_states']) if tasks_entry else {}
+            self._fold_tasks(task_states, self._find_tasks(project, tasks_entry))
             
-            # Calculate percentage
-            percentage = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
+            if tasks_entry:
+                try:
+                    counts = self.client.get(f"/projects/{project_gid}/task_counts", {}, fields=['num_tasks'])
+                    task_states, tasks_entry = self._check_task_count(project, task_states, tasks_entry,
+                                                                      counts.get('num_tasks'))
+                except Exception:
+                    pass
             
             # Get project status
-            try:
-                statuses = self.client.project_statuses.find_by_project(project_gid, {
-                    'opt_fields': 'text,color,created_at'
-                })
-                if statuses:
-                    latest_status = max(statuses, key=lambda x: x.get('created_at', ''))
-                    color = latest_status.get('color', None)
-                    
-                    if color == 'green':
-                        status_text = 'On track'
-                    elif color == 'blue':
-                        status_text = 'On hold'
-                    elif color == 'yellow':
-                        status_text = 'At risk'
-                    elif color == 'red':
-                        status_text = 'Off track'
-                    elif color == 'complete':
-                        status_text = 'Completed'
-                    else:
-                        status_text = 'No status'
-                else:
-                    status_text = 'No status'
-            except Exception:
-                if project.get('completed', False):
-                    status_text = 'Completed'
-                elif project.get('archived', False):
-                    status_text = 'Archived'
-                else:
-                    status_text = 'Active'
+            if self._is_finished(project):
+                # Completed and archived projects are labelled from the project itself
+                status_text = self.get_fallback_status_text(project)
+            else:
+                try:
+                    statuses = self.client.project_statuses.find_by_project(project_gid, {
+                        'opt_fields': 'text,color,created_at'
+                    })
+                    status_text = self.get_status_text(list(statuses))
+                except Exception:
+                    status_text = self.get_fallback_status_text(project)
             
-            return {
-                'name': project_name,
-                'workspace': project.get('workspace_name', 'Unknown'),
-                'total_tasks': total_tasks,
-                'completed_tasks': completed_tasks,
-                'percentage': percentage,
-                'completed': project.get('completed', False),
-                'archived': project.get('archived', False),
-                'status': status_text,
-                'color': project.get('color', 'light-blue')
-            }
+            return self._store_progress(project, task_states, status_text, fetched_at, tasks_entry)
             
         except Exception as e:
+            return self.build_error_info(project)
+    
+    def _incremental_entry(self, entry):
+        # Task states may only be updated incrementally until their full fetch is too old
+        if not entry or 'full_fetch_ts' not in entry:
+            return None
+        if time.time() - entry['full_fetch_ts'] >= CACHE_EXPIRE_SECONDS:
+            return None
+        return entry
+    
+    def _tasks_action(self, project: Dict[str, Any], entry) -> Dict[str, Any]:
+        if entry:
             return {
-                'name': project.get('name', 'Unknown'),
-                'workspace': project.get('workspace_name', 'Unknown'),
-                'total_tasks': 0,
-                'completed_tasks': 0,
-                'percentage': 0,
-                'completed': project.get('completed', False),
-                'archived': project.get('archived', False),
-                'status': 'Error',
-                'color': 'red'
+                'relative_path': "/tasks",
+                'method': 'get',
+                'data': {'project': project['gid'], 'modified_since': entry['ts']},
+                'options': {'limit': 100, 'fields': ['completed']}
             }
+        return {
+            'relative_path': f"/projects/{project['gid']}/tasks",
+            'method': 'get',
+            'options': {'limit': 100, 'fields': ['completed']}
+        }
+    
+    def _find_tasks(self, project: Dict[str, Any], entry, **options):
+        # Tasks are requested 100 per page and only with the field we count
+        if entry:
+            return self.client.tasks.find_all({
+                'project': project['gid'],
+                'modified_since': entry['ts'],
+                'opt_fields': 'completed'
+            }, page_size=100, **options)
+        return self.client.tasks.find_by_project(project['gid'], {
+            'opt_fields': 'completed'
+        }, page_size=100, **options)
+    
+    def _check_task_count(self, project: Dict[str, Any], task_states: Dict[str, bool], tasks_entry,
+                          num_tasks):
+        """
+        Rebuild incrementally updated task states from a full fetch when they disagree
+        with the project's task count, e.g. after tasks were deleted or moved out.
+        
+        Args:
+            project: Project dictionary from Asana API
+            task_states: Completion state by task gid
+            tasks_entry: Cache entry the task states were updated from
+            num_tasks: Task count reported by Asana, or None if unknown
+            
+        Returns:
+            Tuple of (task states, cache entry or None after a full fetch)
+        """
+        if num_tasks is None or num_tasks == len(task_states):
+            return task_states, tasks_entry
+        task_states = {}
+        self._fold_tasks(task_states, self._find_tasks(project, None))
+        return task_states, None
+    
+    def _fold_tasks(self, task_states: Dict[str, bool], tasks):
+        for task in tasks:
+            task_states[task['gid']] = task.get('completed', False)
+    
+    def _is_finished(self, project: Dict[str, Any]) -> bool:
+        return bool(project.get('archived', False) or project.get('completed', False))
+    
+    def get_cached_entry(self, project: Dict[str, Any]):
+        """
+        Get the cached task states for a project from the on-disk cache.
+        
+        Args:
+            project: Project dictionary from Asana API
+            
+        Returns:
+            Cache entry dictionary, or None if the project is not cached
+        """
+        if self.cache is None:
+            return None
+        try:
+            return self.cache.get(f"project:{project['gid']}")
+        except Exception:
+            return None
     
-    def update_projects_display(self, projects: List[Dict[str, Any]]):
+    def _store_progress(self, project: Dict[str, Any], task_states: Dict[str, bool], status_text: str,
+                        fetched_at: str, tasks_entry) -> Dict[str, Any]:
         """
-        Update the projects display with new data in a compact table layout.
+        Store task states for a project in the on-disk cache and build its progress dictionary.
+        
+        Args:
+            project: Project dictionary from Asana API
+            task_states: Completion state by task gid
+            status_text: Project status text
+            fetched_at: ISO timestamp taken before the tasks were requested
+            tasks_entry: Cache entry the task states were updated from, or None after a full fetch
+            
+        Returns:
+            Dictionary with progress information
+        """
+        total_tasks = len(task_states)
+        completed_tasks = sum(task_states.values())
+        if tasks_entry:
+            full_fetch_ts = tasks_entry['full_fetch_ts']
+        else:
+            full_fetch_ts = datetime.fromisoformat(fetched_at).timestamp()
+        cursor = datetime.fromisoformat(fetched_at) - timedelta(seconds=MODIFIED_SINCE_MARGIN_SECONDS)
+        entry = {
+            'total': total_tasks,
+            'completed': completed_tasks,
+            'task_states': task_states,
+            'ts': cursor.isoformat(),
+            'full_fetch_ts': full_fetch_ts,
+        }
+        # Incremental updates keep the deadline of the last full fetch instead of extending it
+        expire = full_fetch_ts + CACHE_EXPIRE_SECONDS - time.time()
+        if self.cache is not None and expire > 0:
+            try:
+                self.cache.set(f"project:{project['gid']}", entry, expire=expire)
+            except Exception:
+                pass
+        return self.build_progress_info(project, total_tasks, completed_tasks, status_text)
+    
+    def get_status_text(self, statuses: List[Dict[str, Any]]) -> str:
+        """
+        Get display text for the most recent project status update.
+        
+        Args:
+            statuses: Project status dictionaries from Asana API
+            
+        Returns:
+            Status text
+        """
+        if not statuses:
+            return 'No status'
+        
+        # Single pass over the statuses; ISO 8601 timestamps compare correctly as strings
+        latest_status = None
+        latest_ts = ''
+        for status in statuses:
+            ts = status.get('created_at', '')
+            if latest_status is None or ts > latest_ts:
+                latest_ts, latest_status = ts, status
+        return _STATUS_BY_COLOR.get(latest_status.get('color', None), 'No status')
+    
+    def get_fallback_status_text(self, project: Dict[str, Any]) -> str:
+        """
+        Get status text from the project itself when status updates are unavailable.
+        
+        Args:
+            project: Project dictionary from Asana API
+            
+        Returns:
+            Status text
+        """
+        if project.get('completed', False):
+            return 'Completed'
+        elif project.get('archived', False):
+            return 'Archived'
+        else:
+            return 'Active'
+    
+    def build_progress_info(self, project: Dict[str, Any], total_tasks: int,
+                            completed_tasks: int, status_text: str) -> Dict[str, Any]:
+        """
+        Build the progress dictionary used by the display.
+        
+        Args:
+            project: Project dictionary from Asana API
+            total_tasks: Number of tasks in the project
+            completed_tasks: Number of completed tasks in the project
+            status_text: Project status text
+            
+        Returns:
+            Dictionary with progress information
+        """
+        # Calculate percentage
+        percentage = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
+        
+        return {
+            'name': project.get('name', 'Unnamed Project'),
+            'workspace': project.get('workspace_name', 'Unknown'),
+            'total_tasks': total_tasks,
+            'completed_tasks': completed_tasks,
+            'percentage': percentage,
+            'completed': project.get('completed', False),
+            'archived': project.get('archived', False),
+            'status': status_text,
+            'color': project.get('color', 'light-blue')
+        }
+    
+    def build_error_info(self, project: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the progress dictionary for a project that failed to load.
+        
+        Args:
+            project: Project dictionary from Asana API
+            
+        Returns:
+            Dictionary with progress information
+        """
+        return {
+            'name': project.get('name', 'Unknown'),
+            'workspace': project.get('workspace_name', 'Unknown'),
+            'total_tasks': 0,
+            'completed_tasks': 0,
+            'percentage': 0,
+            'completed': project.get('completed', False),
+            'archived': project.get('archived', False),
+            'status': 'Error',
+            'color': 'red'
+        }
+    
+    def append_project_rows(self, projects: List[Dict[str, Any]]):
+        """
+        Add projects to the display while loading continues, keeping the scroll position.
         Args:
             projects: List of project progress dictionaries
         """
-        self.projects_data = projects
-        self.clear_projects_display()
-
         if not projects:
-            self.loading_label.configure(text="No projects found")
             return
 
+        # Update summary counters in place
+        if self._summary_source is not self.projects_data:
+            self.update_summary(self.projects_data)
+        self.projects_data.extend(projects)
+        added_counts = self.count_projects(projects)
+        self._summary_counts = tuple(a + b for a, b in zip(self._summary_counts, added_counts))
+        self.show_summary_counts()
+
+        # Insert each project in place instead of re-sorting everything loaded so far
+        workspace_added = False
+        for project in projects:
+            workspace_added |= self._insert_project_item(project)
+
         # Update workspace filter options
-        workspaces = list(set(p['workspace'] for p in projects))
-        workspaces.insert(0, "All Workspaces")
-        self.workspace_menu.configure(values=workspaces)
+        if workspace_added:
+            self.workspace_menu.configure(values=["All Workspaces"] + self.workspace_names)
 
-        # Update summary
-        self.update_summary(projects)
+        self.list_frame.grid()
+        self.display_items = self._filtered_items()
+        self._render_visible_rows()
 
-        # Group projects by workspace
-        workspace_groups = {}
-        for project in projects:
-            workspace_name = project['workspace']
-            if workspace_name not in workspace_groups:
-                workspace_groups[workspace_name] = []
-            workspace_groups[workspace_name].append(project)
-
-        row = 0
-        for workspace_name, workspace_projects in workspace_groups.items():
-            # Workspace header (aligned with table)
-            workspace_frame = ctk.CTkFrame(self.projects_frame, fg_color="transparent")
-            workspace_frame.grid(row=row, column=0, padx=20, pady=(20, 0), sticky="w")
-            workspace_frame.grid_columnconfigure(0, weight=1)
-            ctk.CTkLabel(
-                workspace_frame,
-                text=f"Workspace: {workspace_name}",
-                font=ctk.CTkFont(size=16, weight="bold"),
-                anchor="w",
-                width=630  # sum of all column widths + paddings
-            ).grid(row=0, column=0, padx=0, pady=5, sticky="w")
-            row += 1
-
-            # Table header (no Workspace column, new order)
-            table_header = ctk.CTkFrame(self.projects_frame, fg_color="transparent")
-            table_header.grid(row=row, column=0, padx=20, pady=(0, 0), sticky="ew")
-            table_header.grid_columnconfigure(1, weight=1)  # Make progress column expandable
-            
-            # Column definitions (widths must match data rows)
-            col_defs = [240, 200, 90, 100]
-            
-            # Project Name
-            ctk.CTkLabel(
-                table_header,
-                text="Project Name",
-                font=ctk.CTkFont(size=13, weight="bold"),
-                text_color="#bbbbbb",
-                width=col_defs[0],
-                anchor="w"
-            ).grid(row=0, column=0, padx=2, pady=4, sticky="w")
-            
-            # Progress
-            ctk.CTkLabel(
-                table_header,
-                text="Progress",
-                font=ctk.CTkFont(size=13, weight="bold"),
-                text_color="#bbbbbb",
-                width=col_defs[1],
-                anchor="w"
-            ).grid(row=0, column=1, padx=2, pady=4, sticky="w")
-            
-            # Tasks
-            ctk.CTkLabel(
-                table_header,
-                text="Tasks",
-                font=ctk.CTkFont(size=13, weight="bold"),
-                text_color="#bbbbbb",
-                width=col_defs[2],
-                anchor="e"
-            ).grid(row=0, column=2, padx=(2, 18), pady=4, sticky="e")
-            
-            # Status
-            ctk.CTkLabel(
-                table_header,
-                text="Status",
-                font=ctk.CTkFont(size=13, weight="bold"),
-                text_color="#bbbbbb",
-                width=col_defs[3],
-                anchor="w"
-            ).grid(row=0, column=3, padx=2, pady=4, sticky="w")
-            row += 1
-
-            # Sort projects by percentage
-            sorted_projects = sorted(workspace_projects, key=lambda x: x['percentage'], reverse=True)
-            for idx, project in enumerate(sorted_projects):
-                table_row = self.create_project_table_row(project, idx)
-                table_row.grid(row=row, column=0, padx=20, pady=1, sticky="ew")
-                row += 1
+    def _insert_project_item(self, project: Dict[str, Any]) -> bool:
+        """
+        Insert a project into the display items, keeping workspaces sorted by name and
+        projects sorted by percentage (highest first). Items inserted at or above the top
+        of the viewport move the scroll position down, so the rows being read stay in place.
+        Args:
+            project: Project progress dictionary
+        Returns:
+            True if the project's workspace was not shown before
+        """
+        workspace_name = project['workspace']
+        workspace_idx = bisect.bisect_left(self.workspace_names, workspace_name)
+        offset = sum(len(self.items_by_workspace[name]) for name in self.workspace_names[:workspace_idx])
+        showing_all = self.current_workspace_filter == "All Workspaces"
+
+        workspace_added = workspace_name not in self.items_by_workspace
+        if workspace_added:
+            header = ('workspace', workspace_name)
+            self.workspace_names.insert(workspace_idx, workspace_name)
+            self.items_by_workspace[workspace_name] = [header]
+            self.sort_keys_by_workspace[workspace_name] = []
+            self.all_items.insert(offset, header)
+            if showing_all:
+                self._shift_scroll_for_insert(offset)
+
+        # A header followed by its projects, bisected on -percentage
+        sort_keys = self.sort_keys_by_workspace[workspace_name]
+        idx = bisect.bisect_right(sort_keys, -project['percentage'])
+        sort_keys.insert(idx, -project['percentage'])
+        item = ('project', project)
+        self.items_by_workspace[workspace_name].insert(idx + 1, item)
+        self.all_items.insert(offset + idx + 1, item)
+        if showing_all:
+            self._shift_scroll_for_insert(offset + idx + 1)
+        elif self.current_workspace_filter == workspace_name:
+            self._shift_scroll_for_insert(idx + 1)
+        return workspace_added
+
+    def _shift_scroll_for_insert(self, idx: int):
+        # Only anchor once the user has scrolled; a list viewed from the top stays at the top
+        if 0 < self.first_visible_item and idx <= self.first_visible_item:
+            self.first_visible_item += 1
+
+    def finish_projects_display(self):
+        """
+        Finish the projects display once all projects are loaded.
+        """
+        if not self.projects_data:
+            self.loading_label.configure(text="No projects found")
+            self.loading_label.grid()
+            return
+
+        # Fall back to all workspaces when the selected one is gone; the filter
+        # changes then, so scrolling back to the top is expected
+        if (self.current_workspace_filter != "All Workspaces"
+                and self.current_workspace_filter not in self.items_by_workspace):
+            self.current_workspace_filter = "All Workspaces"
+            self.workspace_var.set("All Workspaces")
+            self.apply_workspace_filter()
 
         self.loading_label.grid_remove()
 
-    def create_project_table_row(self, project: Dict[str, Any], idx: int = 0) -> ctk.CTkFrame:
+    def _filtered_items(self) -> List[Tuple[str, Any]]:
+        if self.current_workspace_filter == "All Workspaces":
+            return self.all_items
+        # Selected workspace may not have been loaded (yet)
+        return self.items_by_workspace.get(self.current_workspace_filter, [])
+
+    def apply_workspace_filter(self):
         """
-        Create a compact table row for a project, with fixed column widths and optional alternating background.
+        Show the display items of the selected workspace, or of all workspaces.
+        """
+        self.display_items = self._filtered_items()
+        self.first_visible_item = 0
+        self._render_visible_rows()
+
+    def create_project_table_row(self, idx: int = 0) -> Dict[str, Any]:
+        """
+        Create an empty, fixed-height table row that is recycled while scrolling.
         Args:
-            project: Project data dictionary
-            idx: Row index for alternating background
+            idx: Row position in the viewport
         Returns:
-            CTkFrame containing the table row
+            Dictionary with the row frame and its widgets
         """
-        # Use default gray background for rows
-        bg_color = None  # Use default CTkFrame color
-        row_frame = ctk.CTkFrame(self.projects_frame, fg_color=bg_color)
+        row_frame = ctk.CTkFrame(self.rows_frame, height=ROW_HEIGHT)
+        row_frame.grid_propagate(False)
+        row_frame.grid_rowconfigure(0, weight=1)
         row_frame.grid_columnconfigure(1, weight=1)
 
-        # Column definitions (widths must match header)
-        col_defs = [240, 200, 90, 100]
-        # Project Name
-        ctk.CTkLabel(
-            row_frame,
-            text=project['name'],
-            font=ctk.CTkFont(size=13, weight="bold"),
-            anchor="w",
-            width=col_defs[0]
-        ).grid(row=0, column=0, padx=2, pady=4, sticky="w")
+        # Project Name (or workspace title for header rows)
+        name_label = ctk.CTkLabel(row_frame, text="", font=self._FONT_NAME, anchor="w", width=COLUMN_WIDTHS[0])
+        name_label.grid(row=0, column=0, padx=2, pady=0, sticky="w")
 
         # Progress (small bar + percent)
-        progress_frame = ctk.CTkFrame(row_frame, fg_color="transparent", width=col_defs[1])
+        progress_frame = ctk.CTkFrame(row_frame, fg_color="transparent", width=COLUMN_WIDTHS[1])
         progress_frame.grid_columnconfigure(0, weight=1)
         progress_bar = ctk.CTkProgressBar(progress_frame, height=10, width=100)
-        progress_bar.set(project['percentage'] / 100)
         progress_bar.grid(row=0, column=0, padx=(0, 4), pady=0, sticky="ew")
-        ctk.CTkLabel(
-            progress_frame,
-            text=f"{project['percentage']:.1f}%",
-            font=ctk.CTkFont(family="Consolas", size=12),
-            width=50,
-            anchor="e"
-        ).grid(row=0, column=1, padx=0, pady=0, sticky="e")
-        progress_frame.grid(row=0, column=1, padx=2, pady=4, sticky="ew")
+        percent_label = ctk.CTkLabel(progress_frame, text="", font=self._FONT_MONO, width=50, anchor="e")
+        percent_label.grid(row=0, column=1, padx=0, pady=0, sticky="e")
+        progress_frame.grid(row=0, column=1, padx=2, pady=0, sticky="ew")
 
         # Tasks
-        ctk.CTkLabel(
-            row_frame,
-            text=f"{project['completed_tasks']}/{project['total_tasks']}",
-            font=ctk.CTkFont(family="Consolas", size=12),
-            width=col_defs[2],
-            anchor="e"
-        ).grid(row=0, column=2, padx=(2, 18), pady=4, sticky="e")  # Extra right padding before status
+        tasks_label = ctk.CTkLabel(row_frame, text="", font=self._FONT_MONO, width=COLUMN_WIDTHS[2], anchor="e")
+        tasks_label.grid(row=0, column=2, padx=(2, 18), pady=0, sticky="e")  # Extra right padding before status
 
         # Status
-        status_color = self.get_status_color(project['status'])
-        ctk.CTkLabel(
-            row_frame,
-            text=project['status'],
-            font=ctk.CTkFont(size=12),
-            text_color=status_color,
-            anchor="w",
-            width=col_defs[3]
-        ).grid(row=0, column=3, padx=2, pady=4, sticky="w")
+        status_label = ctk.CTkLabel(row_frame, text="", font=self._FONT_STATUS, anchor="w", width=COLUMN_WIDTHS[3])
+        status_label.grid(row=0, column=3, padx=2, pady=0, sticky="w")
+
+        return {
+            'frame': row_frame,
+            'name': name_label,
+            'progress_frame': progress_frame,
+            'progress_bar': progress_bar,
+            'percent': percent_label,
+            'tasks': tasks_label,
+            'status': status_label,
+            'fg_color': row_frame.cget("fg_color"),
+            'kind': None,
+        }
+
+    def fill_table_row(self, row: Dict[str, Any], item: Tuple[str, Any],
+                       pending_bar_sets: List[Tuple[ctk.CTkProgressBar, float]]):
+        """
+        Show a display item in a pooled table row.
+        Args:
+            row: Row dictionary from create_project_table_row
+            item: ('workspace', name) or ('project', project data dictionary)
+            pending_bar_sets: Collects (progress bar, value) pairs to set once all rows are laid out
+        """
+        kind, data = item
+        if kind == 'workspace':
+            if row['kind'] != 'workspace':
+                row['frame'].configure(fg_color="transparent")
+                row['name'].configure(font=self._FONT_SECTION, width=WORKSPACE_HEADER_WIDTH)
+                row['progress_frame'].grid_remove()
+                row['tasks'].grid_remove()
+                row['status'].grid_remove()
+            row['name'].configure(text=f"Workspace: {data}")
+        else:
+            if row['kind'] != 'project':
+                row['frame'].configure(fg_color=row['fg_color'])
+                row['name'].configure(font=self._FONT_NAME, width=COLUMN_WIDTHS[0])
+                row['progress_frame'].grid()
+                row['tasks'].grid()
+                row['status'].grid()
+            row['name'].configure(text=data['name'])
+            value = data['percentage'] / 100
+            if row.get('progress_value') != value:
+                row['progress_value'] = value
+                pending_bar_sets.append((row['progress_bar'], value))
+            row['percent'].configure(text=f"{data['percentage']:.1f}%")
+            row['tasks'].configure(text=f"{data['completed_tasks']}/{data['total_tasks']}")
+            row['status'].configure(text=data['status'], text_color=self.get_status_color(data['status']))
+        row['kind'] = kind
+
+    def _visible_row_count(self) -> int:
+        height = self.rows_frame.winfo_height()
+        row_height = (ROW_HEIGHT + 2) * ctk.ScalingTracker.get_widget_scaling(self.rows_frame)
+        return max(1, int(height // row_height))
+
+    def _render_visible_rows(self):
+        """
+        Fill the pooled rows with the display items currently in the viewport.
+        """
+        visible = self._visible_row_count()
+        total = len(self.display_items)
+        while len(self.row_pool) < min(visible, total):
+            self.row_pool.append(self.create_project_table_row(len(self.row_pool)))
+
+        self.first_visible_item = max(0, min(self.first_visible_item, total - visible))
+        pending_bar_sets = []
+        for i, row in enumerate(self.row_pool):
+            item_idx = self.first_visible_item + i
+            if i < visible and item_idx < total:
+                # Rows are filled before they are mapped and only gridded once
+                self.fill_table_row(row, self.display_items[item_idx], pending_bar_sets)
+                if not row['frame'].winfo_manager():
+                    row['frame'].grid(row=i, column=0, padx=0, pady=1, sticky="ew")
+            elif row['frame'].winfo_manager():
+                row['frame'].grid_remove()
+
+        # Each set() redraws the bar's canvas, so only do it after the layout pass
+        for progress_bar, value in pending_bar_sets:
+            progress_bar.set(value)
+
+        if total > visible:
+            self.projects_scrollbar.set(self.first_visible_item / total, (self.first_visible_item + visible) / total)
+        else:
+            self.projects_scrollbar.set(0, 1)
 
-        return row_frame
+    def _on_projects_scroll(self, action: str, amount: str, unit: str = "units"):
+        """
+        Scrollbar command, follows the Tk yview protocol.
+        """
+        total = len(self.display_items)
+        if action == "moveto":
+            self.first_visible_item = int(float(amount) * total)
+        elif action == "scroll":
+            step = int(float(amount))
+            if unit == "pages":
+                step *= self._visible_row_count()
+            self.first_visible_item += step
+        self._render_visible_rows()
+
+    def _on_projects_mousewheel(self, event):
+        # Only scroll when the pointer is over the project list
+        if not str(event.widget).startswith(str(self.rows_frame)):
+            return
+        if event.num == 4 or event.delta > 0:
+            self._on_projects_scroll("scroll", -3)
+        else:
+            self._on_projects_scroll("scroll", 3)
     
-    def get_status_color(self, status: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_status_color(status: str) -> str:
         """
         Get color for project status.
         
@@ -622,21 +1162,10 @@ To get your Asana API key:
         Returns:
             Color string
         """
-        status_lower = status.lower()
-        if status_lower == 'on track':
-            return "#00ff00"  # Green
-        elif status_lower == 'on hold':
-            return "#0080ff"  # Blue
-        elif status_lower == 'at risk':
-            return "#ffff00"  # Yellow
-        elif status_lower == 'off track':
-            return "#ff0000"  # Red
-        elif status_lower == 'completed':
-            return "#00ff00"  # Green
-        elif 'archived' in status_lower:
+        status_key = status.casefold()
+        if 'archived' in status_key:
             return "#808080"  # Gray
-        else:
-            return "#ffffff"  # White
+        return _COLOR_BY_STATUS.get(status_key, "#ffffff")  # White by default
     
     def update_summary(self, projects: List[Dict[str, Any]]):
         """
@@ -645,21 +1174,64 @@ To get your Asana API key:
         Args:
             projects: List of project progress dictionaries
         """
-        # Clear existing summary
-        for widget in self.summary_frame.winfo_children():
-            widget.destroy()
-        
-        total_projects = len(projects)
-        completed_projects = sum(1 for p in projects if p['completed'])
-        active_projects = sum(1 for p in projects if not p['completed'] and not p['archived'])
-        archived_projects = sum(1 for p in projects if p['archived'])
+        # Reuse the counts when the same list is shown again
+        if projects is not self._summary_source:
+            self._summary_source = projects
+            self._summary_counts = self.count_projects(projects)
+        self.show_summary_counts()
+    
+    def count_projects(self, projects: List[Dict[str, Any]]) -> Tuple[int, int, int, int, int, int]:
+        """
+        Count projects and tasks for the summary in a single pass.
         
-        total_tasks = sum(p['total_tasks'] for p in projects)
-        completed_tasks = sum(p['completed_tasks'] for p in projects)
+        Args:
+            projects: List of project progress dictionaries
+            
+        Returns:
+            Tuple of (total, completed, active, archived) projects and (total, completed) tasks
+        """
+        total_projects = completed_projects = active_projects = archived_projects = 0
+        total_tasks = completed_tasks = 0
+        for p in projects:
+            total_projects += 1
+            completed_projects += p['completed']
+            archived_projects += p['archived']
+            active_projects += not p['completed'] and not p['archived']
+            total_tasks += p['total_tasks']
+            completed_tasks += p['completed_tasks']
+        return (total_projects, completed_projects, active_projects,
+                archived_projects, total_tasks, completed_tasks)
+    
+    def show_summary_counts(self):
+        """
+        Show the current summary counts in the summary widgets.
+        """
+        (total_projects, completed_projects, active_projects,
+         archived_projects, total_tasks, completed_tasks) = self._summary_counts
         overall_percentage = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
         
+        # Summary widgets are built once and only reconfigured afterwards
+        if not self.summary_value_labels:
+            self.create_summary_widgets()
+        
+        values = [total_projects, active_projects, completed_projects, archived_projects]
+        for value_label, value in zip(self.summary_value_labels, values):
+            value_label.configure(text=str(value))
+        
+        self.summary_progress_bar.set(overall_percentage / 100)
+        self.summary_tasks_label.configure(
+            text=f"{completed_tasks}/{total_tasks} tasks completed ({overall_percentage:.1f}%)"
+        )
+    
+    def create_summary_widgets(self):
+        """
+        Create the summary widgets. The content is built in an unmapped container
+        and shown with a single pack so the layout is computed once.
+        """
+        container = ctk.CTkFrame(self.summary_frame, fg_color="transparent")
+        
         # Summary grid
-        summary_grid = ctk.CTkFrame(self.summary_frame)
+        summary_grid = ctk.CTkFrame(container)
         summary_grid.pack(fill="x", padx=20, pady=10)
         
         # Configure grid columns
@@ -668,49 +1240,55 @@ To get your Asana API key:
         
         # Summary items
         summary_items = [
-            ("Total Projects", str(total_projects), "#ffffff"),
-            ("Active Projects", str(active_projects), "#00ff00"),
-            ("Completed Projects", str(completed_projects), "#0080ff"),
-            ("Archived Projects", str(archived_projects), "#808080"),
+            ("Total Projects", "#ffffff"),
+            ("Active Projects", "#00ff00"),
+            ("Completed Projects", "#0080ff"),
+            ("Archived Projects", "#808080"),
         ]
         
-        for i, (label, value, color) in enumerate(summary_items):
+        self.summary_value_labels = []
+        for i, (label, color) in enumerate(summary_items):
             item_frame = ctk.CTkFrame(summary_grid)
             item_frame.grid(row=0, column=i, padx=10, pady=5, sticky="ew")
             
             ctk.CTkLabel(
                 item_frame,
                 text=label,
-                font=ctk.CTkFont(size=12),
+                font=self._FONT_CAPTION,
                 text_color="gray"
             ).pack(pady=(8, 3))
             
-            ctk.CTkLabel(
+            value_label = ctk.CTkLabel(
                 item_frame,
-                text=value,
-                font=ctk.CTkFont(size=20, weight="bold"),
+                text="0",
+                font=self._FONT_VALUE,
                 text_color=color
-            ).pack(pady=(0, 8))
+            )
+            value_label.pack(pady=(0, 8))
+            self.summary_value_labels.append(value_label)
         
         # Overall progress
-        progress_frame = ctk.CTkFrame(self.summary_frame)
+        progress_frame = ctk.CTkFrame(container)
         progress_frame.pack(fill="x", padx=20, pady=(0, 10))
         
         ctk.CTkLabel(
             progress_frame,
             text="Overall Progress",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._FONT_SECTION
         ).pack(pady=(12, 3))
         
-        progress_bar = ctk.CTkProgressBar(progress_frame)
-        progress_bar.pack(pady=(0, 8), padx=20, fill="x")
-        progress_bar.set(overall_percentage / 100)
+        self.summary_progress_bar = ctk.CTkProgressBar(progress_frame)
+        self.summary_progress_bar.pack(pady=(0, 8), padx=20, fill="x")
+        self.summary_progress_bar.set(0)
         
-        ctk.CTkLabel(
+        self.summary_tasks_label = ctk.CTkLabel(
             progress_frame,
-            text=f"{completed_tasks}/{total_tasks} tasks completed ({overall_percentage:.1f}%)",
-            font=ctk.CTkFont(size=14)
-        ).pack(pady=(0, 12))
+            text="",
+            font=self._FONT_TEXT
+        )
+        self.summary_tasks_label.pack(pady=(0, 12))
+        
+        container.pack(fill="x")
     
     def filter_by_workspace(self, workspace: str):
         """
@@ -720,15 +1298,22 @@ To get your Asana API key:
             workspace: Workspace name to filter by
         """
         self.current_workspace_filter = workspace
-        self.update_projects_display(self.projects_data)
+        # Rows are already grouped by workspace, so only the visible items change
+        if self.items_by_workspace:
+            self.apply_workspace_filter()
     
     def clear_projects_display(self):
         """
         Clear the projects display.
         """
-        for widget in self.projects_frame.winfo_children():
-            if widget != self.loading_label:
-                widget.destroy()
+        self.projects_data = []
+        self.display_items = []
+        self.all_items = []
+        self.items_by_workspace = {}
+        self.sort_keys_by_workspace = {}
+        self.workspace_names = []
+        self.first_visible_item = 0
+        self.list_frame.grid_remove()
     
     def show_error(self, message: str):
         """